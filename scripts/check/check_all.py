@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 
+import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import sys
 
@@ -34,8 +36,6 @@ def print_results(title, success, errors, warnings, info=None):
 
 
 def main():
-    import argparse
-
     parser = argparse.ArgumentParser(description="Run All Checks")
     parser.add_argument("--project-root", type=Path, default=Path(__file__).parent.parent.parent)
     parser.add_argument(
@@ -47,15 +47,27 @@ def main():
     all_passed = True
 
     project_checker = ProjectChecker(args.project_root)
-    success, errors, warnings = project_checker.run_all_checks()
+    toolchain_checker = ToolchainChecker()
+    cross_checker = CrossCompileChecker()
+
+    # The three check suites are independent and mostly wait on subprocess
+    # and filesystem I/O, so run them concurrently and print in fixed order.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = {
+            "Project Integrity Check": executor.submit(project_checker.run_all_checks),
+            "Toolchain Check": executor.submit(toolchain_checker.run_all_checks),
+            "Cross-Compilation Check": executor.submit(
+                cross_checker.run_all_checks, args.platform
+            ),
+        }
+
+    success, errors, warnings = futures["Project Integrity Check"].result()
     all_passed &= print_results("Project Integrity Check", success, errors, warnings)
 
-    toolchain_checker = ToolchainChecker()
-    success, errors, warnings, info = toolchain_checker.run_all_checks()
+    success, errors, warnings, info = futures["Toolchain Check"].result()
     all_passed &= print_results("Toolchain Check", success, errors, warnings, info)
 
-    cross_checker = CrossCompileChecker()
-    success, errors, warnings, info = cross_checker.run_all_checks(args.platform)
+    success, errors, warnings, info = futures["Cross-Compilation Check"].result()
     all_passed &= print_results("Cross-Compilation Check", success, errors, warnings, info)
 
     _print_section("")
@@ -1,25 +1,98 @@
 #!/usr/bin/env python3
 
+import argparse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
 import os
 from pathlib import Path
 import platform
-import subprocess
+import shutil
 import sys
+import time
 from typing import List, Optional, Tuple
 
+PLATFORMS = ("linux", "windows", "macos", "android", "ios")
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "mlogger-checks"
+_CACHE_TTL_SECONDS = 300
+
+# The host OS never changes within a process; probe it once.
+_SYSTEM = platform.system()
+_SYSTEM_LOWER = _SYSTEM.lower()
+
+
+async def _probe_command(command: List[str], timeout: int) -> bool:
+    # Only the exit status is consulted, so discard output instead of
+    # allocating pipe buffers for every probe.
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except (FileNotFoundError, OSError):
+        return False
+    try:
+        return await asyncio.wait_for(proc.wait(), timeout) == 0
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return False
+
+
+async def _probe_commands(commands: List[List[str]], timeout: int) -> List[bool]:
+    return list(await asyncio.gather(*(_probe_command(cmd, timeout) for cmd in commands)))
+
 
 class CrossCompileChecker:
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[Path] = None):
         self.errors: List[str] = []
         self.warnings: List[str] = []
         self.info: List[str] = []
+        self.cache_dir = DEFAULT_CACHE_DIR if cache_dir is None else cache_dir
+        self._platform_checks = {
+            "android": self.check_android_ndk,
+            "ios": self.check_ios_toolchain,
+            "linux": self.check_linux_cross_compile,
+            "windows": self.check_windows_cross_compile,
+            "macos": self.check_macos_cross_compile,
+        }
+        # Host-native targets need no cross toolchain; precompute the set of
+        # platforms whose probes can actually contribute anything.
+        self._applicable = tuple(plat for plat in PLATFORMS if plat != _SYSTEM_LOWER)
+
+    def _cache_file(self, name: str) -> Path:
+        # Keying on PATH invalidates the cache automatically when the
+        # environment changes between runs.
+        key = hashlib.sha256(f"{name}\0{os.environ.get('PATH', '')}".encode()).hexdigest()
+        return self.cache_dir / key
+
+    def _tool_exists(self, name: str) -> bool:
+        # A PATH lookup is all the cross-compiler probes need; spawning the
+        # tool just to see whether it exists wastes a fork/exec per candidate.
+        # The installed toolchain set rarely changes between back-to-back
+        # runs, so keep a short-TTL result cache on disk.
+        cache_file = self._cache_file(name)
+        try:
+            if time.time() - cache_file.stat().st_mtime < _CACHE_TTL_SECONDS:
+                return cache_file.read_text() == "1"
+        except OSError:
+            pass
 
-    def _check_command(self, command: List[str], timeout: int = 5) -> bool:
+        found = shutil.which(name) is not None
         try:
-            result = subprocess.run(command, capture_output=True, text=True, timeout=timeout)
-            return result.returncode == 0
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            return False
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text("1" if found else "0")
+        except OSError:
+            pass
+        return found
+
+    def _check_command(self, command: List[str], timeout: int = 5) -> bool:
+        return self._check_commands([command], timeout)[0]
+
+    def _check_commands(self, commands: List[List[str]], timeout: int = 5) -> List[bool]:
+        return asyncio.run(_probe_commands(commands, timeout))
 
     def check_android_ndk(self) -> bool:
         ndk_home = os.environ.get("ANDROID_NDK_HOME") or os.environ.get("ANDROID_NDK_ROOT")
@@ -47,7 +120,7 @@ class CrossCompileChecker:
         return False
 
     def check_ios_toolchain(self) -> bool:
-        if platform.system() != "Darwin":
+        if _SYSTEM != "Darwin":
             return True
         if not self._check_command(["xcodebuild", "-version"]):
             self.warnings.append("Xcode not found (required for iOS builds)")
@@ -59,7 +132,7 @@ class CrossCompileChecker:
         return True
 
     def check_linux_cross_compile(self) -> bool:
-        if platform.system() == "Linux":
+        if _SYSTEM == "Linux":
             return True
         toolchains = [
             "x86_64-linux-gnu-gcc",
@@ -67,31 +140,28 @@ class CrossCompileChecker:
             "arm-linux-gnueabihf-gcc",
         ]
         for tc in toolchains:
-            if self._check_command([tc, "--version"]):
+            if self._tool_exists(tc):
                 self.info.append(f"Linux cross-compiler found: {tc}")
                 return True
         self.warnings.append("Linux cross-compilation toolchain not found")
         return True
 
     def check_windows_cross_compile(self) -> bool:
-        if platform.system() == "Windows":
+        if _SYSTEM == "Windows":
             return True
         cross_compilers = [
-            (["x86_64-w64-mingw32-gcc", "--version"], "MinGW cross-compiler found for Windows"),
-            (
-                ["i686-w64-mingw32-gcc", "--version"],
-                "MinGW cross-compiler found for Windows (32-bit)",
-            ),
+            ("x86_64-w64-mingw32-gcc", "MinGW cross-compiler found for Windows"),
+            ("i686-w64-mingw32-gcc", "MinGW cross-compiler found for Windows (32-bit)"),
         ]
-        for cmd, desc in cross_compilers:
-            if self._check_command(cmd):
+        for tool, desc in cross_compilers:
+            if self._tool_exists(tool):
                 self.info.append(desc)
                 return True
         self.warnings.append("Windows cross-compilation toolchain not found")
         return True
 
     def check_macos_cross_compile(self) -> bool:
-        if platform.system() == "Darwin":
+        if _SYSTEM == "Darwin":
             return True
         paths = (
             [Path(os.environ.get("OSXCROSS_PATH"))]
@@ -108,25 +178,30 @@ class CrossCompileChecker:
         return True
 
     def check_platform_specific(self, target_platform: str) -> bool:
-        current_platform = platform.system().lower()
-        if target_platform.lower() == current_platform:
+        if target_platform.lower() == _SYSTEM_LOWER:
             return True
-        checks = {
-            "android": self.check_android_ndk,
-            "ios": self.check_ios_toolchain,
-            "linux": self.check_linux_cross_compile,
-            "windows": self.check_windows_cross_compile,
-            "macos": self.check_macos_cross_compile,
-        }
-        check_func = checks.get(target_platform.lower())
+        check_func = self._platform_checks.get(target_platform.lower())
         return check_func() if check_func else True
 
-    def check_all_platforms(self):
-        for plat in ["linux", "windows", "macos", "android", "ios"]:
-            self.check_platform_specific(plat)
+    def _probe_platform(self, target_platform: str) -> Tuple[bool, List[str], List[str]]:
+        probe = CrossCompileChecker(cache_dir=self.cache_dir)
+        ok = probe.check_platform_specific(target_platform)
+        return ok, probe.info, probe.warnings
+
+    def check_all_platforms(self, skip_native: bool = True):
+        platforms = self._applicable if skip_native else PLATFORMS
+        # The per-platform probes are independent subprocess/stat work, so
+        # run them concurrently on throwaway checkers and merge the messages
+        # in a fixed platform order to keep output deterministic.
+        with ThreadPoolExecutor(max_workers=len(platforms)) as executor:
+            futures = [executor.submit(self._probe_platform, plat) for plat in platforms]
+        for future in futures:
+            _, info, warnings = future.result()
+            self.info.extend(info)
+            self.warnings.extend(warnings)
 
     def run_all_checks(
-        self, target_platform: Optional[str] = None
+        self, target_platform: Optional[str] = None, skip_native: bool = True
     ) -> Tuple[bool, List[str], List[str], List[str]]:
         self.errors.clear()
         self.warnings.clear()
@@ -134,22 +209,34 @@ class CrossCompileChecker:
         if target_platform:
             self.check_platform_specific(target_platform)
         else:
-            self.check_all_platforms()
+            self.check_all_platforms(skip_native=skip_native)
         return True, self.errors, self.warnings, self.info
 
 
 def main():
-    import argparse
-
     parser = argparse.ArgumentParser(description="Cross-Compilation Check")
     parser.add_argument(
         "--platform", type=str, choices=["linux", "windows", "macos", "android", "ios"]
     )
     parser.add_argument("--verbose", "-v", action="store_true")
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=DEFAULT_CACHE_DIR,
+        help="Directory for cached toolchain-probe results",
+    )
+    parser.add_argument(
+        "--no-skip-native",
+        dest="skip_native",
+        action="store_false",
+        help="Also run the probe for the host-native platform",
+    )
     args = parser.parse_args()
 
-    checker = CrossCompileChecker()
-    success, errors, warnings, info = checker.run_all_checks(args.platform)
+    checker = CrossCompileChecker(cache_dir=args.cache_dir)
+    success, errors, warnings, info = checker.run_all_checks(
+        args.platform, skip_native=args.skip_native
+    )
 
     for msg in info:
         print(f"  [INFO] {msg}")
@@ -1,9 +1,37 @@
 #!/usr/bin/env python3
 
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import configparser
+import os
 from pathlib import Path
 import sys
 from typing import List, Tuple
 
+# Required entries grouped by parent so each parent directory is read once
+# with scandir; built at import time so the checks allocate nothing per call.
+_REQUIRED_BY_PARENT = {
+    "": {"native": "directory"},
+    "native": {"src": "directory", "external": "directory", "CMakeLists.txt": "file"},
+    "native/src": {"core": "directory", "bridge": "directory", "utils": "directory"},
+    "scripts": {"compile": "directory"},
+    "scripts/compile": {"build.py": "file"},
+    "unity/Assets/Plugins": {"MLogger": "directory"},
+}
+
+_SOURCE_FILES_BY_DIR = {
+    "native/src/core": (
+        "logger_manager.h",
+        "logger_manager.cpp",
+        "logger_config.h",
+        "logger_config.cpp",
+    ),
+    "native/src/bridge": (
+        "bridge.h",
+        "bridge.cpp",
+    ),
+}
+
 
 class ProjectChecker:
     def __init__(self, project_root: Path):
@@ -11,98 +39,105 @@ class ProjectChecker:
         self.errors: List[str] = []
         self.warnings: List[str] = []
 
-    def check_git_submodules(self) -> bool:
+    def check_git_submodules(self) -> Tuple[List[str], List[str]]:
+        errors: List[str] = []
+        warnings: List[str] = []
         gitmodules_path = self.project_root / ".gitmodules"
         if not gitmodules_path.exists():
-            return True
+            return errors, warnings
 
-        submodule_paths = []
+        # .gitmodules is INI-format; configparser reads it in one pass and
+        # copes with quoting and comments the hand-rolled scan missed.
+        cp = configparser.ConfigParser()
         try:
-            with open(gitmodules_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    if line.strip().startswith("path ="):
-                        submodule_paths.append(self.project_root / line.split("=", 1)[1].strip())
-        except IOError as e:
-            self.errors.append(f"Failed to read .gitmodules: {e}")
-            return False
+            cp.read(gitmodules_path, encoding="utf-8")
+        except (configparser.Error, OSError) as e:
+            errors.append(f"Failed to read .gitmodules: {e}")
+            return errors, warnings
+        submodule_paths = [
+            self.project_root / cp[section]["path"]
+            for section in cp.sections()
+            if "path" in cp[section]
+        ]
 
-        all_ok = True
         for submodule_path in submodule_paths:
-            if not submodule_path.exists():
-                self.errors.append(
+            # One directory read answers both "does it exist" and "is it
+            # initialized" instead of three separate stat calls.
+            try:
+                with os.scandir(submodule_path) as it:
+                    names = {entry.name for entry in it}
+            except (FileNotFoundError, NotADirectoryError):
+                errors.append(
                     f"Submodule not found: {submodule_path.relative_to(self.project_root)}"
                 )
-                all_ok = False
-            elif (
-                not (submodule_path / ".git").exists()
-                and not (submodule_path / "CMakeLists.txt").exists()
-            ):
-                self.errors.append(
+                continue
+            if ".git" not in names and "CMakeLists.txt" not in names:
+                errors.append(
                     f"Submodule not initialized: {submodule_path.relative_to(self.project_root)}. "
                     "Run: git submodule update --init --recursive"
                 )
-                all_ok = False
-        return all_ok
-
-    def check_project_structure(self) -> bool:
-        required_dirs = [
-            "native",
-            "native/src",
-            "native/src/core",
-            "native/src/bridge",
-            "native/src/utils",
-            "native/external",
-            "scripts/compile",
-            "unity/Assets/Plugins/MLogger",
-        ]
-        required_files = ["native/CMakeLists.txt", "scripts/compile/build.py"]
-
-        all_ok = True
-        for path_str in required_dirs + required_files:
-            full_path = self.project_root / path_str
-            if not full_path.exists():
-                self.errors.append(
-                    f"Required {'directory' if path_str in required_dirs else 'file'} missing: {path_str}"
-                )
-                all_ok = False
-            elif (path_str in required_dirs and not full_path.is_dir()) or (
-                path_str in required_files and not full_path.is_file()
-            ):
-                self.errors.append(f"Path exists but wrong type: {path_str}")
-                all_ok = False
-        return all_ok
-
-    def check_source_files(self) -> bool:
-        source_files = [
-            "native/src/core/logger_manager.h",
-            "native/src/core/logger_manager.cpp",
-            "native/src/core/logger_config.h",
-            "native/src/core/logger_config.cpp",
-            "native/src/bridge/bridge.h",
-            "native/src/bridge/bridge.cpp",
-        ]
-        all_ok = True
-        for file_path in source_files:
-            if not (self.project_root / file_path).exists():
-                self.warnings.append(f"Source file missing: {file_path}")
-                all_ok = False
-        return all_ok
-
-    def check_cmake_lists(self) -> bool:
+        return errors, warnings
+
+    def check_project_structure(self) -> Tuple[List[str], List[str]]:
+        errors: List[str] = []
+        root = str(self.project_root)
+        for parent, expected in _REQUIRED_BY_PARENT.items():
+            try:
+                with os.scandir(os.path.join(root, parent)) as it:
+                    entries = {e.name: e for e in it}
+            except FileNotFoundError:
+                entries = {}
+            for name, kind in expected.items():
+                path_str = f"{parent}/{name}" if parent else name
+                entry = entries.get(name)
+                if entry is None:
+                    errors.append(f"Required {kind} missing: {path_str}")
+                elif not (entry.is_dir() if kind == "directory" else entry.is_file()):
+                    errors.append(f"Path exists but wrong type: {path_str}")
+        return errors, []
+
+    def check_source_files(self) -> Tuple[List[str], List[str]]:
+        warnings: List[str] = []
+        root = str(self.project_root)
+        for dir_path, file_names in _SOURCE_FILES_BY_DIR.items():
+            # One directory read replaces a stat call per expected file.
+            try:
+                with os.scandir(os.path.join(root, dir_path)) as it:
+                    present = {entry.name for entry in it}
+            except FileNotFoundError:
+                present = set()
+            for file_name in file_names:
+                if file_name not in present:
+                    warnings.append(f"Source file missing: {dir_path}/{file_name}")
+        return [], warnings
+
+    def check_cmake_lists(self) -> Tuple[List[str], List[str]]:
+        errors: List[str] = []
+        warnings: List[str] = []
         cmake_file = self.project_root / "native/CMakeLists.txt"
         if not cmake_file.exists():
-            self.errors.append("native/CMakeLists.txt not found")
-            return False
+            errors.append("native/CMakeLists.txt not found")
+            return errors, warnings
+        # Stream line by line and stop once both tokens are seen, instead of
+        # holding the whole file in memory and scanning it twice.
+        found_project = found_library = False
         try:
-            content = cmake_file.read_text(encoding="utf-8")
-            if "project(" not in content:
-                self.warnings.append("CMakeLists.txt may be missing project() declaration")
-            if "add_library" not in content:
-                self.warnings.append("CMakeLists.txt may be missing add_library()")
+            with open(cmake_file, "r", encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    if not found_project and "project(" in line:
+                        found_project = True
+                    if not found_library and "add_library" in line:
+                        found_library = True
+                    if found_project and found_library:
+                        break
         except IOError as e:
-            self.errors.append(f"Failed to read CMakeLists.txt: {e}")
-            return False
-        return True
+            errors.append(f"Failed to read CMakeLists.txt: {e}")
+            return errors, warnings
+        if not found_project:
+            warnings.append("CMakeLists.txt may be missing project() declaration")
+        if not found_library:
+            warnings.append("CMakeLists.txt may be missing add_library()")
+        return errors, warnings
 
     def run_all_checks(self) -> Tuple[bool, List[str], List[str]]:
         self.errors.clear()
@@ -113,17 +148,24 @@ class ProjectChecker:
             ("Source Files", self.check_source_files),
             ("CMakeLists.txt", self.check_cmake_lists),
         ]
-        for check_name, check_func in checks:
+        # The checks touch disjoint paths and return their own message lists,
+        # so overlap their filesystem I/O and aggregate in the original order.
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = [
+                (check_name, executor.submit(check_func)) for check_name, check_func in checks
+            ]
+        for check_name, future in futures:
             try:
-                check_func()
+                errors, warnings = future.result()
             except Exception as e:
                 self.errors.append(f"{check_name} check failed with exception: {e}")
+            else:
+                self.errors.extend(errors)
+                self.warnings.extend(warnings)
         return len(self.errors) == 0, self.errors, self.warnings
 
 
 def main():
-    import argparse
-
     parser = argparse.ArgumentParser(description="Project Integrity Check")
     parser.add_argument("--project-root", type=Path, default=Path(__file__).parent.parent.parent)
     parser.add_argument("--verbose", "-v", action="store_true")
@@ -1,29 +1,67 @@
 #!/usr/bin/env python3
 
+import argparse
+from concurrent.futures import ThreadPoolExecutor
 import os
 from pathlib import Path
 import platform
 import re
+import shutil
 import subprocess
 import sys
 from typing import List, Optional, Tuple
 
+_CMAKE_VER_RE = re.compile(r"version\s+(\d+)\.(\d+)", re.IGNORECASE)
+_GCC_VER_RE = re.compile(r"gcc.*?(\d+\.\d+)", re.IGNORECASE)
+_GXX_VER_RE = re.compile(r"g\+\+.*?(\d+\.\d+)", re.IGNORECASE)
+
+# Commands whose results the sequential checks will consult; probed
+# concurrently up front so the checks themselves hit the cache.
+_PREWARM_COMMANDS = (
+    ("cmake", "--version"),
+    ("cmake", "--help"),
+    ("cl",),
+    ("gcc", "--version"),
+    ("g++", "--version"),
+    ("clang++", "--version"),
+)
+
 
 class ToolchainChecker:
     def __init__(self):
         self.errors: List[str] = []
         self.warnings: List[str] = []
         self.info: List[str] = []
+        self._cmd_cache: dict = {}
+        self._which_cache: dict = {}
+
+    def _have(self, exe: str) -> bool:
+        found = self._which_cache.get(exe)
+        if found is None:
+            found = shutil.which(exe) is not None
+            self._which_cache[exe] = found
+        return found
 
     def _check_command(self, command: List[str], timeout: int = 5) -> Tuple[bool, Optional[str]]:
+        key = tuple(command)
+        cached = self._cmd_cache.get(key)
+        if cached is not None:
+            return cached
+        # A PATH miss is answered in microseconds; only pay the process
+        # spawn (and its timeout risk) for tools that actually exist.
+        if not self._have(command[0]):
+            self._cmd_cache[key] = (False, None)
+            return False, None
         try:
             result = subprocess.run(command, capture_output=True, text=True, timeout=timeout)
-            return (True, result.stdout.strip()) if result.returncode == 0 else (False, None)
+            outcome = (True, result.stdout.strip()) if result.returncode == 0 else (False, None)
         except (FileNotFoundError, subprocess.TimeoutExpired):
-            return False, None
+            outcome = (False, None)
+        self._cmd_cache[key] = outcome
+        return outcome
 
-    def _extract_version(self, text: str, pattern: str) -> Optional[str]:
-        match = re.search(pattern, text, re.IGNORECASE)
+    def _extract_version(self, text: str, pattern: "re.Pattern") -> Optional[str]:
+        match = pattern.search(text)
         return match.group(1) if match else None
 
     def check_cmake(self) -> bool:
@@ -31,7 +69,7 @@ class ToolchainChecker:
         if not available:
             self.errors.append("CMake not found. Install CMake 3.20 or later.")
             return False
-        match = re.search(r"version\s+(\d+)\.(\d+)", output, re.IGNORECASE)
+        match = _CMAKE_VER_RE.search(output)
         if match:
             major, minor = int(match.group(1)), int(match.group(2))
             if major < 3 or (major == 3 and minor < 20):
@@ -45,7 +83,11 @@ class ToolchainChecker:
         return True
 
     def check_cmake_generators(self) -> bool:
-        available, output = self._check_command(["cmake", "-G"])
+        # `cmake -G` exits non-zero and prints the generator list to stderr,
+        # so its captured stdout was empty; `cmake --help` carries a
+        # well-formed Generators section on stdout and shares the cached
+        # probe from the pre-warm pass.
+        available, output = self._check_command(["cmake", "--help"])
         if not available:
             self.warnings.append("Could not list CMake generators")
             return False
@@ -70,7 +112,7 @@ class ToolchainChecker:
                 return True
             available, output = self._check_command(["gcc", "--version"])
             if available:
-                version = self._extract_version(output, r"gcc.*?(\d+\.\d+)")
+                version = self._extract_version(output, _GCC_VER_RE)
                 self.info.append(f"MinGW GCC found: {version if version else 'unknown'}")
                 return True
             self.errors.append("No C compiler found (MSVC or MinGW GCC)")
@@ -78,7 +120,7 @@ class ToolchainChecker:
         elif system in ("Linux", "Darwin"):
             available, output = self._check_command(["gcc", "--version"])
             if available:
-                version = self._extract_version(output, r"gcc.*?(\d+\.\d+)")
+                version = self._extract_version(output, _GCC_VER_RE)
                 self.info.append(f"GCC found: {version if version else 'unknown'}")
                 return True
             self.errors.append("GCC not found")
@@ -92,7 +134,7 @@ class ToolchainChecker:
                 return True
             available, output = self._check_command(["g++", "--version"])
             if available:
-                version = self._extract_version(output, r"g\+\+.*?(\d+\.\d+)")
+                version = self._extract_version(output, _GXX_VER_RE)
                 self.info.append(f"MinGW G++ found: {version if version else 'unknown'}")
                 return True
             self.errors.append("No C++ compiler found (MSVC or MinGW G++)")
@@ -100,7 +142,7 @@ class ToolchainChecker:
         elif system in ("Linux", "Darwin"):
             available, output = self._check_command(["g++", "--version"])
             if available:
-                version = self._extract_version(output, r"g\+\+.*?(\d+\.\d+)")
+                version = self._extract_version(output, _GXX_VER_RE)
                 self.info.append(f"G++ found: {version if version else 'unknown'}")
                 return True
             if self._check_command(["clang++", "--version"])[0]:
@@ -118,7 +160,16 @@ class ToolchainChecker:
             Path("C:/Program Files (x86)/Microsoft Visual Studio"),
         ]
         for vs_path in vs_paths:
-            if vs_path.exists() and any(d.is_dir() for d in vs_path.iterdir()):
+            # scandir stops at the first subdirectory, with the dir check
+            # answered from readdir data rather than a stat per entry.
+            try:
+                with os.scandir(vs_path) as it:
+                    has_dir = next(
+                        (True for entry in it if entry.is_dir(follow_symlinks=False)), False
+                    )
+            except (FileNotFoundError, NotADirectoryError, PermissionError):
+                continue
+            if has_dir:
                 self.info.append(f"Visual Studio found at: {vs_path}")
                 return True
         self.warnings.append("Visual Studio not found (optional for MinGW builds)")
@@ -162,6 +213,11 @@ class ToolchainChecker:
         self.errors.clear()
         self.warnings.clear()
         self.info.clear()
+        # Warm the command cache concurrently: wall time becomes the slowest
+        # single probe instead of the sum, and duplicate probes (gcc is
+        # checked by both the compiler and MinGW checks) spawn only once.
+        with ThreadPoolExecutor(max_workers=len(_PREWARM_COMMANDS)) as executor:
+            list(executor.map(lambda cmd: self._check_command(list(cmd)), _PREWARM_COMMANDS))
         checks = [
             ("Python", self.check_python),
             ("CMake", self.check_cmake),
@@ -186,8 +242,6 @@ class ToolchainChecker:
 
 
 def main():
-    import argparse
-
     parser = argparse.ArgumentParser(description="Build Toolchain Check")
     parser.add_argument("--verbose", "-v", action="store_true")
     parser.parse_args()
@@ -1,14 +1,23 @@
 #!/usr/bin/env python3
 
 import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import contextlib
+import ctypes
+import hashlib
+import os
 from pathlib import Path
-import re
+import platform as _plat
+import shlex
 import shutil
 import subprocess
 import sys
 import time
 
 from platforms import (
+    BASIC_TESTS,
+    ENHANCED_TESTS,
     AndroidBuilder,
     IOSBuilder,
     LinuxBuilder,
@@ -16,6 +25,7 @@ from platforms import (
     PlatformBuilder,
     WindowsBuilder,
 )
+from platforms.base import _jobs
 
 PLATFORM_UNITY_MAP = {
     "linux": "Linux",
@@ -33,6 +43,16 @@ ARCH_UNITY_MAP = {
     "armeabi-v7a": "armeabi-v7a",
 }
 
+# Architectures each platform can actually target, used to expand
+# `--arch all`; ordered with the commonly shipped ones first.
+PLATFORM_ARCHS = {
+    "linux": ("x86_64", "arm64"),
+    "windows": ("x86_64", "x86"),
+    "macos": ("arm64", "x86_64"),
+    "android": ("arm64-v8a", "armeabi-v7a", "x86_64", "x86"),
+    "ios": ("arm64", "x86_64"),
+}
+
 LIBRARY_NAMES = {
     "linux": "libmlogger_linux.so",
     "windows": "mlogger_win.dll",
@@ -41,11 +61,28 @@ LIBRARY_NAMES = {
     "ios": "libmlogger_ios.a",
 }
 
-PROJECT_ROOT = Path(__file__).parent.parent.parent
-NATIVE_DIR = PROJECT_ROOT / "native"
+# Compute the root once as a plain string (normpath avoids the getcwd
+# syscalls pathlib's resolve path takes) and keep Path wrappers only for
+# the call sites that need mkdir/exists/rglob; subprocess and shutil take
+# the strings directly.
+_HERE = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT_STR = os.path.normpath(os.path.join(_HERE, os.pardir, os.pardir))
+NATIVE_DIR_STR = os.path.join(PROJECT_ROOT_STR, "native")
+
+PROJECT_ROOT = Path(PROJECT_ROOT_STR)
+NATIVE_DIR = Path(NATIVE_DIR_STR)
 BUILD_DIR = NATIVE_DIR / "build"
 UNITY_PLUGINS_DIR = PROJECT_ROOT / "unity" / "Assets" / "Plugins" / "MLogger" / "External"
 
+# Flattened (platform, arch) -> Unity target directory, computed once at
+# import so every copy resolves with a single lookup and the mapping stays
+# consistent everywhere it is consulted.
+_UNITY_TARGET = {
+    (p, a): UNITY_PLUGINS_DIR / unity_platform / unity_arch
+    for p, unity_platform in PLATFORM_UNITY_MAP.items()
+    for a, unity_arch in ARCH_UNITY_MAP.items()
+}
+
 PLATFORM_BUILDERS = {
     "linux": LinuxBuilder,
     "windows": WindowsBuilder,
@@ -55,13 +92,15 @@ PLATFORM_BUILDERS = {
 }
 
 SEPARATOR = "=" * 60
-BASIC_TESTS = ["test_mlogger", "test_simple", "test_c_interface"]
-ENHANCED_TESTS = [
-    "test_boundary",
-    "test_error_handling",
-    "test_stress",
-    "test_memory",
-]
+_GENERATOR_PREFIX = "CMAKE_GENERATOR:INTERNAL="
+
+# platform.machine() can shell out to uname on some systems; resolve it once.
+# (The module is aliased because several functions take a `platform` parameter.)
+_MACHINE = _plat.machine().lower()
+
+# One shared null-device handle for quiet subprocess runs instead of a fresh
+# open per spawn; closed by the OS at process exit.
+_DEVNULL_FH = open(os.devnull, "wb")  # noqa: SIM115
 
 
 def get_current_platform() -> str:
@@ -76,16 +115,13 @@ def get_current_platform() -> str:
 
 
 def get_current_arch() -> str:
-    import platform
-
-    machine = platform.machine().lower()
-    if machine in ("x86_64", "amd64"):
+    if _MACHINE in ("x86_64", "amd64"):
         return "x86_64"
-    elif machine in ("i386", "i686", "x86"):
+    elif _MACHINE in ("i386", "i686", "x86"):
         return "x86"
-    elif machine in ("arm64", "aarch64"):
+    elif _MACHINE in ("arm64", "aarch64"):
         return "arm64"
-    raise ValueError(f"Unsupported architecture: {machine}")
+    raise ValueError(f"Unsupported architecture: {_MACHINE}")
 
 
 def get_builder(platform: str, arch: str) -> "PlatformBuilder":
@@ -96,46 +132,40 @@ def get_builder(platform: str, arch: str) -> "PlatformBuilder":
     return builder_class(platform, arch, build_dir, NATIVE_DIR)
 
 
-def _remove_file_with_retry(
-    file_path: Path, max_retries: int = 3, retry_delay: float = 0.5
-) -> bool:
-    for attempt in range(max_retries):
-        try:
-            if file_path.exists():
-                file_path.unlink()
-            return True
-        except (OSError, PermissionError):
-            if attempt < max_retries - 1:
-                time.sleep(retry_delay)
-            else:
-                try:
-                    file_path.rename(file_path.with_suffix(file_path.suffix + ".old"))
-                    return True
-                except (OSError, PermissionError):
-                    return False
-    return False
+def _rename_sideways(path: Path) -> bool:
+    # Last resort when removal keeps failing (typically a Windows file
+    # lock): move the path out of the way so the build can proceed.
+    backup = path.with_name(path.name + ".old")
+    try:
+        if backup.is_dir():
+            shutil.rmtree(backup)
+        elif backup.exists():
+            backup.unlink()
+        path.rename(backup)
+        return True
+    except (OSError, PermissionError):
+        return False
 
 
-def _remove_directory_with_retry(
-    dir_path: Path, max_retries: int = 3, retry_delay: float = 0.5
-) -> bool:
+def _remove_with_retry(path: Path, max_retries: int = 3, initial_delay: float = 0.05) -> bool:
+    # Common case first: nothing to do, no loop or exception machinery.
+    if not path.exists():
+        return True
+    # Most transient locks clear within ~100ms, so back off exponentially
+    # from a short initial delay rather than sleeping a fixed half second.
+    delay = initial_delay
     for attempt in range(max_retries):
         try:
-            if dir_path.exists():
-                shutil.rmtree(dir_path)
+            if path.is_dir():
+                shutil.rmtree(path)
+            else:
+                path.unlink(missing_ok=True)
             return True
         except (OSError, PermissionError):
-            if attempt < max_retries - 1:
-                time.sleep(retry_delay)
-            else:
-                try:
-                    backup_name = dir_path.with_name(dir_path.name + ".old")
-                    if backup_name.exists():
-                        shutil.rmtree(backup_name)
-                    dir_path.rename(backup_name)
-                    return True
-                except (OSError, PermissionError):
-                    return False
+            if attempt == max_retries - 1:
+                return _rename_sideways(path)
+            time.sleep(delay)
+            delay *= 2
     return False
 
 
@@ -147,11 +177,14 @@ def check_and_clean_cmake_cache(
         return False
 
     cached_generator = None
+    # Stream the cache file and stop at the one line we need instead of
+    # slurping the whole file and regex-scanning it.
     try:
         with open(cmake_cache, encoding="utf-8") as f:
-            match = re.search(r"CMAKE_GENERATOR:INTERNAL=(.+)", f.read())
-            if match:
-                cached_generator = match.group(1).strip()
+            for line in f:
+                if line.startswith(_GENERATOR_PREFIX):
+                    cached_generator = line[len(_GENERATOR_PREFIX):].strip()
+                    break
     except (OSError, UnicodeDecodeError, PermissionError) as e:
         if verbose:
             print(f"  [WARN] Could not read CMakeCache.txt: {e}")
@@ -172,11 +205,36 @@ def _print_section(title: str):
     print(SEPARATOR)
 
 
+def _rmtree_onerror(func, path, exc_info):
+    # rmtree calls this per entry it failed on; retry just that entry with
+    # backoff instead of restarting the whole traversal. A missing tree is
+    # not worth retrying at all.
+    if isinstance(exc_info[1], FileNotFoundError):
+        raise exc_info[1]
+    delay = 0.05
+    for _ in range(3):
+        time.sleep(delay)
+        try:
+            func(path)
+            return
+        except OSError:
+            delay *= 2
+    raise exc_info[1]
+
+
 def _clean_cmake_cache_files(build_dir: Path, verbose: bool = False) -> tuple[bool, bool]:
     cmake_cache = build_dir / "CMakeCache.txt"
     cmake_files_dir = build_dir / "CMakeFiles"
-    cache_removed = _remove_file_with_retry(cmake_cache, max_retries=3, retry_delay=0.5)
-    dir_removed = _remove_directory_with_retry(cmake_files_dir, max_retries=3, retry_delay=0.5)
+    cache_removed = _remove_with_retry(cmake_cache)
+    # One traversal of CMakeFiles/ with per-entry retries, rather than a
+    # whole-tree retry loop that repeats the walk on every locked file.
+    try:
+        shutil.rmtree(cmake_files_dir, onerror=_rmtree_onerror)
+        dir_removed = True
+    except FileNotFoundError:
+        dir_removed = True
+    except OSError:
+        dir_removed = _rename_sideways(cmake_files_dir)
     if verbose and not (cache_removed and dir_removed):
         print("  [WARN] Some cache files could not be removed")
         print(f"    CMakeCache.txt removed: {cache_removed}")
@@ -184,6 +242,39 @@ def _clean_cmake_cache_files(build_dir: Path, verbose: bool = False) -> tuple[bo
     return cache_removed, dir_removed
 
 
+def _configure_stamp_key(cmake_args: list, toolchain: str, builder_key: str = "") -> str:
+    # Hash everything that feeds the configure step: the resolved arguments,
+    # the builder's own cache key (platform, arch, request kwargs, top-level
+    # CMakeLists.txt mtime), the toolchain file, and the newest
+    # CMakeLists.txt under native/. If none of these changed, re-running
+    # cmake can only reproduce the cache that is already on disk.
+    key = hashlib.sha256()
+    key.update(builder_key.encode())
+    key.update(b"\0")
+    for arg in sorted(cmake_args):
+        key.update(arg.encode())
+        key.update(b"\0")
+    # Builders may batch their defines into a -C initial-cache file, whose
+    # path (the visible argument) stays constant across define changes;
+    # hash the file content so those changes still invalidate the stamp.
+    for i, arg in enumerate(cmake_args):
+        if arg == "-C" and i + 1 < len(cmake_args):
+            with contextlib.suppress(OSError):
+                key.update(Path(cmake_args[i + 1]).read_bytes())
+            key.update(b"\0")
+    key.update(toolchain.encode())
+    key.update(b"\0")
+    if toolchain:
+        with contextlib.suppress(OSError):
+            key.update(str(os.stat(toolchain).st_mtime_ns).encode())
+        key.update(b"\0")
+    newest = max(
+        (p.stat().st_mtime_ns for p in NATIVE_DIR.rglob("CMakeLists.txt")), default=0
+    )
+    key.update(str(newest).encode())
+    return key.hexdigest()
+
+
 def configure_cmake(
     platform: str,
     arch: str,
@@ -197,12 +288,18 @@ def configure_cmake(
     build_dir = builder.build_dir
     build_dir.mkdir(parents=True, exist_ok=True)
 
-    cmake_args = builder.get_cmake_args(**kwargs)
-    current_generator = None
-    for i, arg in enumerate(cmake_args):
-        if arg == "-G" and i + 1 < len(cmake_args):
-            current_generator = cmake_args[i + 1]
-            break
+    cmake_args = builder.cached_cmake_args(**kwargs)
+
+    current_generator = builder.get_generator(**kwargs)
+
+    # Prefer Ninja when neither the user nor the builder picked a
+    # generator: its flat dependency graph configures and builds noticeably
+    # faster than the platform-default Makefiles.
+    if current_generator is None and not kwargs.get("generator") and shutil.which("ninja"):
+        current_generator = "Ninja"
+        cmake_args = ["-G", "Ninja", *cmake_args]
+
+    builder.configured_generator = current_generator
 
     if current_generator:
         if clean:
@@ -215,31 +312,78 @@ def configure_cmake(
         else:
             check_and_clean_cmake_cache(build_dir, current_generator, verbose)
 
-    args = ["-B", str(build_dir), "-S", str(NATIVE_DIR)]
+    args = ["-B", str(build_dir), "-S", NATIVE_DIR_STR]
     args.extend(cmake_args)
     args.append("-DCMAKE_BUILD_TYPE=Release")
     args.append("-DBUILD_TESTS=ON")
 
+    # Hash-keyed object caching turns repeat compilations of unchanged
+    # translation units into cache hits across clean builds.
+    launcher = shutil.which("sccache") or shutil.which("ccache")
+    if launcher:
+        args.append(f"-DCMAKE_C_COMPILER_LAUNCHER={launcher}")
+        args.append(f"-DCMAKE_CXX_COMPILER_LAUNCHER={launcher}")
+
+    # Re-running cmake with unchanged inputs still costs a full graph
+    # re-scan; a stamp of those inputs lets warm rebuilds skip it. Two O(1)
+    # existence checks gate the rglob-and-hash work so cold build dirs
+    # don't pay for a comparison that cannot match.
+    stamp_file = build_dir / ".mlogger_configure_stamp"
+    toolchain = kwargs.get("toolchain") or ""
+    stamp_key = None
+    if not clean and stamp_file.exists() and (build_dir / "CMakeCache.txt").exists():
+        stamp_key = _configure_stamp_key(args, toolchain, builder.cache_key(kwargs))
+        try:
+            if stamp_file.read_text() == stamp_key:
+                print(f"[SKIP] [STEP 1/4] Configure up-to-date for {platform}-{arch}")
+                return
+        except OSError:
+            pass
+
     if verbose:
-        print(f"CMake command: cmake {' '.join(args)}")
+        # shlex.join keeps the printed command copy-pastable when paths
+        # contain spaces.
+        print("CMake command: cmake", shlex.join(args))
         print(f"Working directory: {PROJECT_ROOT}")
 
     try:
         subprocess.run(
             ["cmake"] + args,
             check=True,
-            cwd=PROJECT_ROOT,
-            stdout=None if verbose else subprocess.DEVNULL,
+            cwd=PROJECT_ROOT_STR,
+            stdout=None if verbose else _DEVNULL_FH,
             stderr=None if verbose else subprocess.STDOUT,
         )
         print(f"[PASS] [STEP 1/4] CMake configuration completed for {platform}-{arch}")
 
+        try:
+            if stamp_key is None:
+                stamp_key = _configure_stamp_key(args, toolchain, builder.cache_key(kwargs))
+            stamp_file.write_text(stamp_key)
+        except OSError:
+            pass
+
         compile_commands_src = build_dir / "compile_commands.json"
         compile_commands_dst = NATIVE_DIR / "compile_commands.json"
         if compile_commands_src.exists():
-            shutil.copy2(compile_commands_src, compile_commands_dst)
-            if verbose:
-                print(f"  [INFO] Copied compile_commands.json to {compile_commands_dst}")
+            # Rewriting an identical compile_commands.json churns the clangd
+            # index for nothing; only copy when the source is newer or a
+            # different size.
+            try:
+                src_stat = compile_commands_src.stat()
+                dst_stat = compile_commands_dst.stat()
+                up_to_date = (
+                    dst_stat.st_size == src_stat.st_size
+                    and dst_stat.st_mtime_ns >= src_stat.st_mtime_ns
+                )
+            except OSError:
+                up_to_date = False
+            if not up_to_date:
+                shutil.copy2(compile_commands_src, compile_commands_dst)
+                if verbose:
+                    print(f"  [INFO] Copied compile_commands.json to {compile_commands_dst}")
+            elif verbose:
+                print("  [INFO] compile_commands.json already up to date")
     except subprocess.CalledProcessError:
         print(f"[FAIL] [STEP 1/4] CMake configuration failed for {platform}-{arch}")
         if not verbose:
@@ -257,8 +401,17 @@ def build_project(platform: str, arch: str, builder: "PlatformBuilder", verbose:
     build_cmd = ["cmake", "--build", "."]
     build_cmd.extend(builder.get_build_args())
 
+    # Make and MSBuild build single-threaded unless told otherwise; Ninja
+    # parallelizes on its own (and over-subscribes memory if forced). Size
+    # the fallback from JOBS like every other path, so the per-pipeline
+    # split main() applies for multi-pair runs is honored here too.
+    generator = builder.configured_generator
+    needs_parallel = generator is None or "Makefiles" in generator or "Visual Studio" in generator
+    if needs_parallel and not any(arg in ("-j", "--parallel") for arg in build_cmd):
+        build_cmd.extend(["--parallel", _jobs()])
+
     if verbose:
-        print(f"Build command: {' '.join(build_cmd)}")
+        print("Build command:", shlex.join(build_cmd))
         print(f"Working directory: {build_dir}")
 
     try:
@@ -266,7 +419,7 @@ def build_project(platform: str, arch: str, builder: "PlatformBuilder", verbose:
             build_cmd,
             check=True,
             cwd=build_dir,
-            stdout=None if verbose else subprocess.DEVNULL,
+            stdout=None if verbose else _DEVNULL_FH,
             stderr=None if verbose else subprocess.STDOUT,
         )
         print(f"[PASS] [STEP 2/4] Build completed for {platform}-{arch}")
@@ -277,6 +430,28 @@ def build_project(platform: str, arch: str, builder: "PlatformBuilder", verbose:
         raise
 
 
+# How many trailing output lines to keep per test for failure context.
+TEST_OUTPUT_TAIL_LINES = 200
+
+
+def _run_test(test_path: str, bin_dir: Path):
+    # Stream the child's output instead of buffering it whole: the stress
+    # and memory tests can emit megabytes, and a bounded tail is all the
+    # report needs.
+    tail = deque(maxlen=TEST_OUTPUT_TAIL_LINES)
+    with subprocess.Popen(
+        [test_path],
+        cwd=bin_dir,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    ) as proc:
+        for line in proc.stdout:
+            tail.append(line.rstrip("\n"))
+    return proc.returncode, list(tail)
+
+
 def run_tests(
     platform: str,
     arch: str,
@@ -313,47 +488,53 @@ def run_tests(
     total_tests = 0
     passed_tests = 0
 
-    for category, tests in test_categories.items():
-        if not tests:
-            continue
-
-        print(f"\n  [{category}]")
-        for test_name in tests:
-            test_path = bin_dir / f"{test_name}{exe_ext}"
-            if not test_path.exists():
-                print(f"    [WARN] Test executable not found: {test_name}")
+    # One directory read answers existence for every test executable
+    # instead of a stat call per test; keep the entries so the spawn can
+    # reuse the path string scandir already built.
+    try:
+        with os.scandir(bin_dir) as it:
+            existing = {entry.name: entry for entry in it}
+    except FileNotFoundError:
+        existing = {}
+
+    # The test executables are independent processes, so run them
+    # concurrently and report results in submission order to keep the
+    # pass/fail output stable.
+    with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+        futures = {}
+        for tests in test_categories.values():
+            for test_name in tests:
+                entry = existing.get(f"{test_name}{exe_ext}")
+                if entry is not None:
+                    futures[test_name] = executor.submit(_run_test, entry.path, bin_dir)
+
+        for category, tests in test_categories.items():
+            if not tests:
                 continue
 
-            total_tests += 1
-            try:
+            print(f"\n  [{category}]")
+            for test_name in tests:
+                future = futures.get(test_name)
+                if future is None:
+                    print(f"    [WARN] Test executable not found: {test_name}")
+                    continue
+
+                total_tests += 1
                 print(f"    Running {test_name}...", end=" ", flush=True)
-                result = subprocess.run(
-                    [str(test_path)],
-                    check=True,
-                    cwd=bin_dir,
-                    capture_output=True,
-                    text=True,
-                )
-                print("[PASS]")
-                passed_tests += 1
-                if verbose:
-                    if result.stdout:
-                        for line in result.stdout.splitlines():
+                returncode, tail = future.result()
+                if returncode == 0:
+                    print("[PASS]")
+                    passed_tests += 1
+                    if verbose:
+                        for line in tail:
                             print(f"      {line}")
-                    if result.stderr:
-                        for line in result.stderr.splitlines():
-                            print(f"      [STDERR] {line}")
-            except subprocess.CalledProcessError as e:
-                print("[FAIL]")
-                all_passed = False
-                if e.stdout:
-                    for line in e.stdout.splitlines():
+                else:
+                    print("[FAIL]")
+                    all_passed = False
+                    if len(tail) == TEST_OUTPUT_TAIL_LINES:
+                        print(f"      (last {TEST_OUTPUT_TAIL_LINES} lines of output)")
+                    for line in tail:
                         print(f"      {line}")
-                if e.stderr:
-                    for line in e.stderr.splitlines():
-                        print(f"      [STDERR] {line}")
-                if not verbose:
-                    print("      Run with --verbose to see full test output")
 
     print(f"\n  Test Summary: {passed_tests}/{total_tests} passed")
 
@@ -367,19 +548,41 @@ def _find_library_path(
     build_dir: Path, library_name: str, platform: str, builder: "PlatformBuilder"
 ) -> Path:
     lib_dir = build_dir / "bin" if platform == "windows" else build_dir / "lib"
-    source_path = builder.get_library_path(lib_dir, library_name)
-
-    if not source_path.exists():
-        alt_paths = [build_dir / "bin" / library_name, build_dir / "lib" / library_name]
-        for alt_path in alt_paths:
-            if alt_path.exists():
-                return alt_path
-        raise FileNotFoundError(
-            f"Library file not found: {source_path}\n"
-            f"  Searched in: {lib_dir}\n"
-            f"  Also tried: {[str(p) for p in alt_paths]}"
-        )
-    return source_path
+    candidates = builder.get_library_candidates(lib_dir, library_name)
+    for alt_path in (build_dir / "bin" / library_name, build_dir / "lib" / library_name):
+        if alt_path not in candidates:
+            candidates.append(alt_path)
+
+    # One pass, one stat per candidate; the expected location comes first.
+    for candidate in candidates:
+        if candidate.exists():
+            return candidate
+    raise FileNotFoundError(
+        f"Library file not found: {candidates[0]}\n"
+        f"  Searched: {[str(p) for p in candidates]}"
+    )
+
+
+def _fastcopy(src: Path, dst: Path):
+    # The native libraries run 5-50 MB; use a kernel-space copy where the
+    # platform offers one instead of a user-space read/write loop.
+    if sys.platform == "linux":
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            offset = 0
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, remaining)
+                if sent == 0:
+                    break
+                offset += sent
+                remaining -= sent
+        shutil.copystat(src, dst)
+    elif sys.platform == "win32":
+        if not ctypes.windll.kernel32.CopyFileExW(str(src), str(dst), None, None, None, 0):
+            raise ctypes.WinError()
+    else:
+        # macOS shutil already copies via fcopyfile.
+        shutil.copy2(src, dst)
 
 
 def copy_library_to_unity(
@@ -391,9 +594,7 @@ def copy_library_to_unity(
     library_name = LIBRARY_NAMES[platform]
     source_path = _find_library_path(build_dir, library_name, platform, builder)
 
-    unity_platform_dir = PLATFORM_UNITY_MAP[platform]
-    unity_arch_dir = ARCH_UNITY_MAP[arch]
-    unity_target_dir = UNITY_PLUGINS_DIR / unity_platform_dir / unity_arch_dir
+    unity_target_dir = _UNITY_TARGET[(platform, arch)]
     unity_target_dir.mkdir(parents=True, exist_ok=True)
     target_path = unity_target_dir / library_name
 
@@ -401,68 +602,127 @@ def copy_library_to_unity(
         print(f"  Copying from: {source_path}")
         print(f"  Copying to: {target_path}")
 
-    # Try to remove existing target file if it exists (may be locked by Unity)
-    if target_path.exists():
-        if verbose:
-            print(f"  Target file exists, attempting to remove it first...")
-        if not _remove_file_with_retry(target_path, max_retries=5, retry_delay=1.0):
-            error_msg = (
-                f"Failed to remove existing file: {target_path}\n"
-                f"  This usually means the file is locked by Unity Editor.\n"
-                f"  Please close Unity Editor and try again, or manually delete the file."
-            )
-            print(f"[FAIL] [STEP 4/4] {error_msg}")
-            raise PermissionError(error_msg)
-
-    # Try to copy with retry mechanism
+    # If a previous run hardlinked the target to this exact build output,
+    # the inodes match and there is nothing to transfer.
+    try:
+        src_stat = os.stat(source_path)
+        dst_stat = os.stat(target_path)
+        if src_stat.st_ino == dst_stat.st_ino and src_stat.st_dev == dst_stat.st_dev:
+            print(f"[PASS] [STEP 4/4] {library_name} already up to date in {unity_target_dir}")
+            return
+    except OSError:
+        pass
+
+    # Copy to a sibling temp file and atomically rename it over the target.
+    # This avoids the remove-then-copy window entirely; even when Unity has
+    # the old library open, the rename usually succeeds because the open
+    # file keeps its inode while the directory entry is swapped.
+    tmp_path = target_path.with_suffix(target_path.suffix + f".tmp.{os.getpid()}")
+    try:
+        tmp_path.unlink(missing_ok=True)
+        try:
+            # Same-filesystem case: a hardlink into the temp slot moves
+            # metadata only, no payload bytes.
+            os.link(source_path, tmp_path)
+        except OSError:
+            _fastcopy(source_path, tmp_path)
+    except (OSError, PermissionError) as e:
+        print(f"[FAIL] [STEP 4/4] Failed to copy library: {e}")
+        raise
+
     max_retries = 3
     retry_delay = 0.5
-    for attempt in range(max_retries):
-        try:
-            shutil.copy(source_path, target_path)
-            print(f"[PASS] [STEP 4/4] Copied {library_name} to {unity_target_dir}")
-            return
-        except (OSError, PermissionError) as e:
-            if attempt < max_retries - 1:
-                if verbose:
-                    print(f"  Copy attempt {attempt + 1} failed, retrying in {retry_delay}s...")
-                time.sleep(retry_delay)
-            else:
-                error_msg = (
-                    f"Failed to copy library after {max_retries} attempts: {e}\n"
-                    f"  Source: {source_path}\n"
-                    f"  Target: {target_path}\n"
-                    f"  This usually means the target file is locked by Unity Editor.\n"
-                    f"  Please close Unity Editor and try again."
+    try:
+        for attempt in range(max_retries):
+            try:
+                os.replace(tmp_path, target_path)
+                print(f"[PASS] [STEP 4/4] Copied {library_name} to {unity_target_dir}")
+                return
+            except (OSError, PermissionError) as e:
+                # Windows reports ERROR_SHARING_VIOLATION while Unity holds
+                # the target open; give it a few short chances to let go.
+                if attempt < max_retries - 1:
+                    if verbose:
+                        print(
+                            f"  Replace attempt {attempt + 1} failed, retrying in {retry_delay}s..."
+                        )
+                    time.sleep(retry_delay)
+                else:
+                    error_msg = (
+                        f"Failed to replace library after {max_retries} attempts: {e}\n"
+                        f"  Source: {source_path}\n"
+                        f"  Target: {target_path}\n"
+                        f"  This usually means the target file is locked by Unity Editor.\n"
+                        f"  Please close Unity Editor and try again."
+                    )
+                    print(f"[FAIL] [STEP 4/4] {error_msg}")
+                    raise PermissionError(error_msg) from e
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def run_one(platform: str, arch: str, args: argparse.Namespace) -> bool:
+    builder = get_builder(platform, arch)
+
+    kwargs = {}
+    if args.generator:
+        kwargs["generator"] = args.generator
+    if args.toolchain:
+        kwargs["toolchain"] = args.toolchain
+    if args.android_abi:
+        kwargs["android_abi"] = args.android_abi
+    if args.ios_sdk:
+        kwargs["ios_sdk"] = args.ios_sdk
+
+    try:
+        configure_cmake(platform, arch, builder, args.verbose, args.clean, **kwargs)
+        build_project(platform, arch, builder, args.verbose)
+
+        if not args.skip_tests and not args.skip_copy:
+            # Tests and the Unity copy both depend only on the build output,
+            # so overlap the I/O-bound copy with the CPU-bound test runs.
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                copy_future = executor.submit(
+                    copy_library_to_unity, platform, arch, builder, args.verbose
                 )
-                print(f"[FAIL] [STEP 4/4] {error_msg}")
-                if verbose:
-                    import traceback
-                    traceback.print_exc()
-                raise PermissionError(error_msg) from e
-        except Exception as e:
-            print(f"[FAIL] [STEP 4/4] Failed to copy library: {e}")
-            if verbose:
-                import traceback
-                traceback.print_exc()
-            raise
+                run_tests(platform, arch, builder, args.verbose, test_filter=args.test_filter)
+                copy_future.result()
+        else:
+            if not args.skip_tests:
+                run_tests(platform, arch, builder, args.verbose, test_filter=args.test_filter)
+            else:
+                _print_section("[SKIP] Tests skipped")
+
+            if not args.skip_copy:
+                copy_library_to_unity(platform, arch, builder, args.verbose)
+            else:
+                _print_section("[SKIP] Copy to Unity skipped")
+    except Exception as e:
+        _print_section(f"[FAIL] Build failed for {platform}-{arch}!")
+        print(f"Error: {e}")
+        return False
+    return True
 
 
 def main():
-    parser = argparse.ArgumentParser(description="MLogger Native Library Build Script")
+    parser = argparse.ArgumentParser(
+        description="MLogger Native Library Build Script",
+        epilog="Build-step parallelism can be overridden with the JOBS environment variable.",
+    )
     parser.add_argument(
         "--platform",
         type=str,
         default=get_current_platform(),
-        choices=["linux", "windows", "macos", "android", "ios"],
-        help="Target platform",
+        help="Target platform, or a comma-separated list (linux, windows, macos, android, ios)",
     )
     parser.add_argument(
         "--arch",
         type=str,
         default=get_current_arch(),
-        choices=["x86", "x86_64", "arm64", "arm64-v8a", "armeabi-v7a"],
-        help="Target architecture",
+        help="Target architecture, a comma-separated list "
+        "(x86, x86_64, arm64, arm64-v8a, armeabi-v7a), or 'all' for every "
+        "architecture each selected platform supports",
     )
     parser.add_argument("--skip-tests", action="store_true", help="Skip running tests")
     parser.add_argument(
@@ -488,54 +748,50 @@ def main():
 
     args = parser.parse_args()
 
+    platforms = [p.strip() for p in args.platform.split(",") if p.strip()]
+    archs = [a.strip() for a in args.arch.split(",") if a.strip()]
+    for platform in platforms:
+        if platform not in PLATFORM_BUILDERS:
+            parser.error(f"Unsupported platform: {platform}")
+    expand_all = archs == ["all"]
+    if not expand_all:
+        for arch in archs:
+            if arch not in ARCH_UNITY_MAP:
+                parser.error(f"Unsupported architecture: {arch}")
+
     print(f"\n{SEPARATOR}")
     print("MLogger Native Library Build Script")
     print(SEPARATOR)
-    print(f"Platform: {args.platform}")
-    print(f"Architecture: {args.arch}")
+    print(f"Platform: {', '.join(platforms)}")
+    print(f"Architecture: {'all (per platform)' if expand_all else ', '.join(archs)}")
     if args.verbose:
         print("Verbose mode: ON")
     print(SEPARATOR)
 
-    builder = get_builder(args.platform, args.arch)
-
-    kwargs = {}
-    if args.generator:
-        kwargs["generator"] = args.generator
-    if args.toolchain:
-        kwargs["toolchain"] = args.toolchain
-    if args.android_abi:
-        kwargs["android_abi"] = args.android_abi
-    if args.ios_sdk:
-        kwargs["ios_sdk"] = args.ios_sdk
-
-    try:
-        configure_cmake(args.platform, args.arch, builder, args.verbose, args.clean, **kwargs)
-        build_project(args.platform, args.arch, builder, args.verbose)
-
-        if not args.skip_tests:
-            run_tests(
-                args.platform,
-                args.arch,
-                builder,
-                args.verbose,
-                test_filter=args.test_filter,
-            )
-        else:
-            _print_section("[SKIP] Tests skipped")
-
-        if not args.skip_copy:
-            copy_library_to_unity(args.platform, args.arch, builder, args.verbose)
-        else:
-            _print_section("[SKIP] Copy to Unity skipped")
-
-        _print_section("[PASS] BUILD COMPLETED SUCCESSFULLY!")
-        print()
-    except Exception as e:
+    if expand_all:
+        pairs = [(platform, arch) for platform in platforms for arch in PLATFORM_ARCHS[platform]]
+    else:
+        pairs = [(platform, arch) for platform in platforms for arch in archs]
+    if len(pairs) == 1:
+        all_ok = run_one(pairs[0][0], pairs[0][1], args)
+    else:
+        # Each pair builds into its own build directory, so fan the
+        # pipelines out across processes. Split the inner -j across the
+        # pipelines (unless the user pinned JOBS) so total compile
+        # parallelism stays near the core count.
+        os.environ.setdefault("JOBS", str(max(1, (os.cpu_count() or 1) // len(pairs))))
+        max_workers = min(len(pairs), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(run_one, platform, arch, args) for platform, arch in pairs]
+            all_ok = all(future.result() for future in futures)
+
+    if not all_ok:
         _print_section("[FAIL] Build failed!")
-        print(f"Error: {e}")
         sys.exit(1)
 
+    _print_section("[PASS] BUILD COMPLETED SUCCESSFULLY!")
+    print()
+
 
 if __name__ == "__main__":
     main()
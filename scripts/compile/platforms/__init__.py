@@ -1,5 +1,5 @@
 from .android import AndroidBuilder
-from .base import PlatformBuilder
+from .base import BASIC_TESTS, ENHANCED_TESTS, PlatformBuilder
 from .ios import IOSBuilder
 from .linux import LinuxBuilder
 from .macos import MacOSBuilder
@@ -12,4 +12,6 @@ __all__ = [
     "MacOSBuilder",
     "AndroidBuilder",
     "IOSBuilder",
+    "BASIC_TESTS",
+    "ENHANCED_TESTS",
 ]
@@ -4,20 +4,27 @@ from .base import PlatformBuilder
 
 
 class AndroidBuilder(PlatformBuilder):
+    def __init__(self, platform: str, arch: str, build_dir, native_dir):
+        super().__init__(platform, arch, build_dir, native_dir)
+        # ABI default and platform level depend only on constructor
+        # arguments; resolve them once.
+        self._default_abi = (
+            self.arch
+            if self.arch in ("arm64-v8a", "armeabi-v7a", "x86_64", "x86")
+            else "arm64-v8a"
+        )
+
     def get_cmake_args(self, **kwargs) -> List[str]:
-        args = []
         toolchain = kwargs.get("toolchain")
         if not toolchain:
             raise ValueError("Android builds require --toolchain")
 
-        args.append(f"-DCMAKE_TOOLCHAIN_FILE={toolchain}")
-        abi = kwargs.get("android_abi") or {
-            "arm64-v8a": "arm64-v8a",
-            "armeabi-v7a": "armeabi-v7a",
-            "x86_64": "x86_64",
-            "x86": "x86",
-        }.get(self.arch, "arm64-v8a")
-
-        args.append(f"-DANDROID_ABI={abi}")
-        args.append("-DANDROID_PLATFORM=android-21")
-        return args
+        abi = kwargs.get("android_abi") or self._default_abi
+        # The toolchain file stays a -D flag (CMake must see it before any
+        # cache processing); the NDK variables ride the initial-cache file.
+        return [
+            f"-DCMAKE_TOOLCHAIN_FILE={toolchain}",
+            *self._write_init_cache(
+                (("ANDROID_ABI", abi), ("ANDROID_PLATFORM", "android-21"))
+            ),
+        ]
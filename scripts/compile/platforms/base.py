@@ -1,35 +1,130 @@
-from abc import ABC, abstractmethod
+import contextlib
+import hashlib
 import os
 from pathlib import Path
-from typing import List
+import subprocess
+import sys
+from typing import List, Optional, Tuple
 
+# Host-OS booleans shared by every builder; sys.platform never changes
+# within a process.
+IS_LINUX = sys.platform == "linux"
+IS_MACOS = sys.platform == "darwin"
+IS_WIN = sys.platform == "win32"
 
-class PlatformBuilder(ABC):
+
+# Shared, immutable test rosters; every builder (and the driver's category
+# report) refers to these same tuples instead of rebuilding lists per call.
+BASIC_TESTS = ("test_mlogger", "test_simple", "test_c_interface")
+ENHANCED_TESTS = ("test_boundary", "test_error_handling", "test_stress", "test_memory")
+_ALL_TESTS = BASIC_TESTS + ENHANCED_TESTS
+
+# Prefer the schedulable CPU set where the OS exposes it: inside cgroup-
+# limited containers cpu_count() reports the host's cores and would
+# oversubscribe the quota.
+if hasattr(os, "sched_getaffinity"):
+    _DEFAULT_JOBS = str(len(os.sched_getaffinity(0)) or os.cpu_count() or 4)
+else:
+    _DEFAULT_JOBS = str(os.cpu_count() or 4)
+
+
+def _jobs() -> str:
+    # JOBS is consulted per call rather than frozen at import: the driver
+    # lowers it in the environment when fanning out multiple pipelines,
+    # which under fork happens after this module was imported.
+    return os.environ.get("JOBS") or _DEFAULT_JOBS
+
+
+def _run_fast(argv: List[str], timeout: int = 10) -> Optional[str]:
+    # Minimal capture helper for tool probes: one stdout pipe, stderr
+    # discarded, ASCII decode (the probed tools emit ASCII). Returns None
+    # on spawn failure, timeout, or a non-zero exit.
+    try:
+        proc = subprocess.Popen(argv, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    except OSError:
+        return None
+    try:
+        out, _ = proc.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.communicate()
+        return None
+    return out.decode("ascii", "replace") if proc.returncode == 0 else None
+
+
+class PlatformBuilder:
     def __init__(self, platform: str, arch: str, build_dir: Path, native_dir: Path):
         self.platform = platform
         self.arch = arch
         self.build_dir = build_dir
         self.native_dir = native_dir
+        self._cmake_args_cache = {}
+        # Flags that depend only on the constructor arguments; subclasses
+        # fill this in so get_cmake_args skips the per-call branch ladder.
+        self._base_cmake_args: Tuple[str, ...] = ()
+        # Set by the configure step; lets the build step pick parallelism
+        # appropriate for the generator actually in use.
+        self.configured_generator = None
 
-    @abstractmethod
     def get_cmake_args(self, **kwargs) -> List[str]:
-        pass
+        raise NotImplementedError
+
+    def cached_cmake_args(self, **kwargs) -> List[str]:
+        # get_cmake_args may probe the filesystem or spawn tools (generator
+        # detection, SDK lookups); memoize per kwargs so the pipeline steps
+        # that need the args pay that cost only once.
+        key = tuple(sorted(kwargs.items()))
+        args = self._cmake_args_cache.get(key)
+        if args is None:
+            args = self.get_cmake_args(**kwargs)
+            self._cmake_args_cache[key] = args
+        return list(args)
+
+    def cache_key(self, kwargs: dict) -> str:
+        # Identity of a configure result from the builder's point of view:
+        # who we are, what was requested, and the top-level CMakeLists.txt
+        # revision. blake2b is the fastest stdlib hash and 16 bytes is
+        # ample for a cache key.
+        key = hashlib.blake2b(digest_size=16)
+        key.update(f"{self.platform}:{self.arch}".encode())
+        for item in sorted(kwargs.items()):
+            key.update(repr(item).encode())
+        with contextlib.suppress(OSError):
+            key.update(str(os.path.getmtime(self.native_dir / "CMakeLists.txt")).encode())
+        return key.hexdigest()
+
+    def _write_init_cache(self, defines) -> List[str]:
+        # Collapse a batch of -D flags into one -C initial-cache file:
+        # CMake loads it in a single include() and quoting survives paths
+        # with spaces (the iOS SDK path, notably). The file is only
+        # rewritten when its content changes.
+        content = "".join(
+            f'set({name} "{value}" CACHE STRING "" FORCE)\n' for name, value in defines
+        )
+        cache_path = self.build_dir / "_mlogger_init_cache.cmake"
+        try:
+            unchanged = cache_path.read_text() == content
+        except OSError:
+            unchanged = False
+        if not unchanged:
+            self.build_dir.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(content)
+        return ["-C", str(cache_path)]
+
+    def get_generator(self, **kwargs) -> Optional[str]:
+        # One scan over the memoized args; builders that resolve the
+        # generator themselves override with a direct answer.
+        args = self.cached_cmake_args(**kwargs)
+        for i, arg in enumerate(args):
+            if arg == "-G" and i + 1 < len(args):
+                return args[i + 1]
+        return None
 
     def get_build_args(self) -> List[str]:
-        return ["-j", os.environ.get("JOBS", "4")]
-
-    def get_test_executables(self) -> List[str]:
-        return [
-            # Basic tests
-            "test_mlogger",
-            "test_simple",
-            "test_c_interface",
-            # Enhanced tests
-            "test_boundary",
-            "test_error_handling",
-            "test_stress",
-            "test_memory",
-        ]
+        return ["-j", _jobs()]
+
+    def get_test_executables(self) -> Tuple[str, ...]:
+        return _ALL_TESTS
 
     def get_executable_extension(self) -> str:
         return ""
@@ -37,5 +132,7 @@ class PlatformBuilder(ABC):
     def can_run_tests(self) -> bool:
         return True
 
-    def get_library_path(self, lib_dir: Path, library_name: str) -> Path:
-        return lib_dir / library_name
+    def get_library_candidates(self, lib_dir: Path, library_name: str) -> List[Path]:
+        # Candidate artifact locations ordered by likelihood; the driver
+        # probes each exactly once.
+        return [lib_dir / library_name]
@@ -1,52 +1,51 @@
+from functools import lru_cache
+import os
 from pathlib import Path
-import subprocess
 from typing import List
 
-from .base import PlatformBuilder
+from .base import IS_MACOS, PlatformBuilder, _run_fast
 
 
-class IOSBuilder(PlatformBuilder):
-    def get_cmake_args(self, **kwargs) -> List[str]:
-        import sys
+@lru_cache(maxsize=8)
+def _resolve_ios_sdk_path(sdk: str) -> str:
+    # xcrun reparses Xcode metadata on every invocation (hundreds of ms);
+    # a device + simulator build would otherwise pay it once per arch.
+    # Falls back to the name unchanged when xcrun is unavailable.
+    sdk_path = _run_fast(["xcrun", "--sdk", sdk, "--show-sdk-path"])
+    return sdk_path.strip() if sdk_path else sdk
+
 
-        args = []
-        is_macos = sys.platform == "darwin"
+class IOSBuilder(PlatformBuilder):
+    def __init__(self, platform: str, arch: str, build_dir, native_dir):
+        super().__init__(platform, arch, build_dir, native_dir)
+        # Pinning CMAKE_ARCHIVE_OUTPUT_DIRECTORY stops Xcode generators
+        # from dropping the static library at the build root, so the
+        # library lookup below is a single known path.
+        self._lib_dir = os.path.join(str(self.build_dir), "lib")
+        base = [
+            ("CMAKE_SYSTEM_NAME", "iOS"),
+            ("CMAKE_ARCHIVE_OUTPUT_DIRECTORY", self._lib_dir),
+        ]
+        if self.arch in ("arm64", "x86_64"):
+            base.append(("CMAKE_OSX_ARCHITECTURES", self.arch))
+        self._base_defines = tuple(base)
 
-        if not is_macos:
+    def get_cmake_args(self, **kwargs) -> List[str]:
+        if not IS_MACOS:
             raise ValueError(
                 "iOS builds can only be performed on macOS. "
                 "Please run this script on a macOS system."
             )
 
-        args.append("-DCMAKE_SYSTEM_NAME=iOS")
-        if self.arch == "arm64":
-            args.append("-DCMAKE_OSX_ARCHITECTURES=arm64")
-        elif self.arch == "x86_64":
-            args.append("-DCMAKE_OSX_ARCHITECTURES=x86_64")
-
         ios_sdk = kwargs.get("ios_sdk", "iphoneos")
-        if ios_sdk.startswith("/"):
-            args.append(f"-DCMAKE_OSX_SYSROOT={ios_sdk}")
-        else:
-            try:
-                result = subprocess.run(
-                    ["xcrun", "--sdk", ios_sdk, "--show-sdk-path"],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-                args.append(f"-DCMAKE_OSX_SYSROOT={result.stdout.strip()}")
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                args.append(f"-DCMAKE_OSX_SYSROOT={ios_sdk}")
-        return args
+        if not ios_sdk.startswith("/"):
+            ios_sdk = _resolve_ios_sdk_path(ios_sdk)
+        return self._write_init_cache([*self._base_defines, ("CMAKE_OSX_SYSROOT", ios_sdk)])
 
     def can_run_tests(self) -> bool:
         return False
 
-    def get_library_path(self, lib_dir: Path, library_name: str) -> Path:
-        path = lib_dir / library_name
-        if not path.exists():
-            alt_path = self.build_dir / library_name
-            if alt_path.exists():
-                return alt_path
-        return path
+    def get_library_candidates(self, _lib_dir: Path, library_name: str) -> List[Path]:
+        # The archive output directory is pinned at configure time, so the
+        # artifact has exactly one home; the passed-in directory is ignored.
+        return [Path(os.path.join(self._lib_dir, library_name))]
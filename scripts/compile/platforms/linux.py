@@ -1,25 +1,27 @@
-import sys
-from typing import List
+from typing import ClassVar, List
+import warnings
 
-from .base import PlatformBuilder
+from .base import IS_LINUX, PlatformBuilder
 
 
 class LinuxBuilder(PlatformBuilder):
-    def get_cmake_args(self, **kwargs) -> List[str]:
-        args = []
-        is_linux = sys.platform == "linux"
-
-        if not is_linux:
-            toolchain = kwargs.get("toolchain")
-            if toolchain:
-                args.append(f"-DCMAKE_TOOLCHAIN_FILE={toolchain}")
-            else:
-                args.append("-DCMAKE_SYSTEM_NAME=Linux")
-                import warnings
+    # One warning per process is enough for multi-arch sweeps, and the
+    # guard also skips the per-call warning-filter scan.
+    _warned_cross: ClassVar[bool] = False
 
-                warnings.warn(
-                    "Cross-compiling for Linux from non-Linux system. "
-                    "Consider using --toolchain for better compatibility.",
-                    UserWarning,
-                )
-        return args
+    def get_cmake_args(self, **kwargs) -> List[str]:
+        # Native Linux builds contribute nothing; return before touching
+        # kwargs at all.
+        if IS_LINUX:
+            return []
+        toolchain = kwargs.get("toolchain")
+        if toolchain:
+            return [f"-DCMAKE_TOOLCHAIN_FILE={toolchain}"]
+        if not LinuxBuilder._warned_cross:
+            LinuxBuilder._warned_cross = True
+            warnings.warn(
+                "Cross-compiling for Linux from non-Linux system. "
+                "Consider using --toolchain for better compatibility.",
+                UserWarning,
+            )
+        return ["-DCMAKE_SYSTEM_NAME=Linux"]
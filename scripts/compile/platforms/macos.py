@@ -1,26 +1,22 @@
-import sys
 from typing import List
 
-from .base import PlatformBuilder
+from .base import IS_MACOS, PlatformBuilder
 
 
 class MacOSBuilder(PlatformBuilder):
-    def get_cmake_args(self, **kwargs) -> List[str]:
-        args = []
-        is_macos = sys.platform == "darwin"
+    def __init__(self, platform: str, arch: str, build_dir, native_dir):
+        super().__init__(platform, arch, build_dir, native_dir)
+        # The arch flag depends only on constructor arguments.
+        if self.arch in ("arm64", "x86_64"):
+            self._base_cmake_args = (f"-DCMAKE_OSX_ARCHITECTURES={self.arch}",)
 
-        if not is_macos:
+    def get_cmake_args(self, **kwargs) -> List[str]:
+        if not IS_MACOS:
             toolchain = kwargs.get("toolchain")
             if toolchain:
-                args.append(f"-DCMAKE_TOOLCHAIN_FILE={toolchain}")
-            else:
-                raise ValueError(
-                    "Cross-compiling for macOS from non-macOS system requires --toolchain. "
-                    "Consider using osxcross or build on macOS directly."
-                )
-        else:
-            if self.arch == "arm64":
-                args.append("-DCMAKE_OSX_ARCHITECTURES=arm64")
-            elif self.arch == "x86_64":
-                args.append("-DCMAKE_OSX_ARCHITECTURES=x86_64")
-        return args
+                return [f"-DCMAKE_TOOLCHAIN_FILE={toolchain}"]
+            raise ValueError(
+                "Cross-compiling for macOS from non-macOS system requires --toolchain. "
+                "Consider using osxcross or build on macOS directly."
+            )
+        return [*self._base_cmake_args]
@@ -1,27 +1,58 @@
+from functools import lru_cache
+import json
 import os
 import re
+import shutil
 import subprocess
-import sys
-from typing import List, Optional
+from typing import ClassVar, List, Optional
 import warnings
 
-from .base import PlatformBuilder
+from .base import IS_WIN, PlatformBuilder, _jobs
+
+# Resolve cmake once; spawning with the absolute path skips the per-launch
+# PATH walk (the dominant subprocess-startup cost on Windows), and a PATH
+# miss is answered without attempting a spawn at all.
+_CMAKE_EXE = shutil.which("cmake")
+
+_MSYS_VARS = ("MSYSTEM", "MSYS", "MSYS2_PATH")
+# "msys" is a prefix of "msys64"/"msys2", so one case-insensitive search
+# covers all three without lowercasing the (potentially huge) PATH string.
+_MSYS_RE = re.compile(r"msys", re.IGNORECASE)
+_VS_GEN_RE = re.compile(r"Visual Studio \d+ \d{4}")
+
+
+@lru_cache(maxsize=1)
+def _available_generators() -> str:
+    # `cmake -G` with no argument exits non-zero by design but prints the
+    # generator list (to stderr) on every supported CMake version, so merge
+    # the streams and ignore the exit status. Cached so the process spawn
+    # happens at most once per run.
+    if _CMAKE_EXE is None:
+        return ""
+    try:
+        result = subprocess.run(
+            [_CMAKE_EXE, "-G"], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, timeout=10
+        )
+    except (subprocess.TimeoutExpired, OSError):
+        return ""
+    return result.stdout.decode("ascii", "replace")
 
 
 class WindowsBuilder(PlatformBuilder):
+    # One cross-compile warning per process is enough for multi-arch
+    # sweeps, and the guard skips the per-call warning-filter scan.
+    _warned_cross: ClassVar[bool] = False
+
     def __init__(self, platform: str, arch: str, build_dir, native_dir):
         super().__init__(platform, arch, build_dir, native_dir)
         self._generator: Optional[str] = None
 
     def _is_msys_environment(self) -> bool:
-        msys_vars = ["MSYSTEM", "MSYS", "MSYS2_PATH"]
-        if any(var in os.environ for var in msys_vars):
+        if any(var in os.environ for var in _MSYS_VARS):
             return True
-        path = os.environ.get("PATH", "").lower()
-        if "msys64" in path or "msys2" in path or "msys" in path:
+        if _MSYS_RE.search(os.environ.get("PATH", "")):
             return True
-        shell = os.environ.get("SHELL", "").lower()
-        return "msys" in shell
+        return _MSYS_RE.search(os.environ.get("SHELL", "")) is not None
 
     def _detect_visual_studio_generator(self) -> Optional[str]:
         known_vs_versions = [
@@ -33,29 +64,7 @@ class WindowsBuilder(PlatformBuilder):
             "Visual Studio 14 2015",
         ]
 
-        available_generators = ""
-        try:
-            result = subprocess.run(["cmake", "-G"], capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                available_generators = result.stdout
-        except (
-            subprocess.TimeoutExpired,
-            subprocess.CalledProcessError,
-            FileNotFoundError,
-        ):
-            try:
-                result = subprocess.run(
-                    ["cmake", "--help"], capture_output=True, text=True, timeout=10
-                )
-                if result.returncode == 0:
-                    available_generators = result.stdout
-            except (
-                subprocess.TimeoutExpired,
-                subprocess.CalledProcessError,
-                FileNotFoundError,
-            ):
-                return None
-
+        available_generators = _available_generators()
         if not available_generators:
             return None
 
@@ -63,43 +72,52 @@ class WindowsBuilder(PlatformBuilder):
             if vs_version in available_generators:
                 return vs_version
 
-        matches = re.findall(r"Visual Studio \d+ \d{4}", available_generators)
+        matches = _VS_GEN_RE.findall(available_generators)
         return matches[0] if matches else None
 
     def _detect_alternative_generator(self) -> str:
-        alternatives = ["MinGW Makefiles", "Ninja", "Unix Makefiles"]
-        try:
-            result = subprocess.run(["cmake", "-G"], capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                for gen in alternatives:
-                    if gen in result.stdout:
-                        return gen
-        except (
-            subprocess.TimeoutExpired,
-            subprocess.CalledProcessError,
-            FileNotFoundError,
-        ):
-            try:
-                result = subprocess.run(
-                    ["cmake", "--help"], capture_output=True, text=True, timeout=10
-                )
-                if result.returncode == 0:
-                    for gen in alternatives:
-                        if gen in result.stdout:
-                            return gen
-            except (
-                subprocess.TimeoutExpired,
-                subprocess.CalledProcessError,
-                FileNotFoundError,
-            ):
-                pass
+        available_generators = _available_generators()
+        for gen in ("MinGW Makefiles", "Ninja", "Unix Makefiles"):
+            if gen in available_generators:
+                return gen
         return "MinGW Makefiles"
 
+    def _generator_cache_key(self) -> Optional[str]:
+        if not _CMAKE_EXE:
+            return None
+        try:
+            return f"{_CMAKE_EXE}:{os.stat(_CMAKE_EXE).st_mtime_ns}"
+        except OSError:
+            return None
+
+    def _load_cached_generator(self) -> Optional[str]:
+        # Keying on the cmake path and mtime invalidates the cache when
+        # cmake is upgraded or swapped out of PATH.
+        key = self._generator_cache_key()
+        if key is None:
+            return None
+        try:
+            data = json.loads((self.build_dir / ".mlogger_generator_cache.json").read_text())
+        except (OSError, ValueError):
+            return None
+        return data.get("generator") if data.get("cmake") == key else None
+
+    def _store_cached_generator(self, generator: str):
+        key = self._generator_cache_key()
+        if key is None:
+            return
+        try:
+            self.build_dir.mkdir(parents=True, exist_ok=True)
+            (self.build_dir / ".mlogger_generator_cache.json").write_text(
+                json.dumps({"cmake": key, "generator": generator})
+            )
+        except OSError:
+            pass
+
     def get_cmake_args(self, **kwargs) -> List[str]:
         args = []
-        is_windows = sys.platform == "win32"
 
-        if not is_windows:
+        if not IS_WIN:
             toolchain = kwargs.get("toolchain")
             if toolchain:
                 args.append(f"-DCMAKE_TOOLCHAIN_FILE={toolchain}")
@@ -112,13 +130,17 @@ class WindowsBuilder(PlatformBuilder):
                 args.extend(["-G", generator])
                 self._generator = generator
                 args.append("-DCMAKE_SYSTEM_NAME=Windows")
-                warnings.warn(
-                    "Cross-compiling for Windows from non-Windows system. "
-                    "Consider using --toolchain for better compatibility.",
-                    UserWarning,
-                )
+                if not WindowsBuilder._warned_cross:
+                    WindowsBuilder._warned_cross = True
+                    warnings.warn(
+                        "Cross-compiling for Windows from non-Windows system. "
+                        "Consider using --toolchain for better compatibility.",
+                        UserWarning,
+                    )
         else:
             generator = kwargs.get("generator")
+            if not generator:
+                generator = self._load_cached_generator()
             if not generator:
                 if self._is_msys_environment():
                     generator = self._detect_alternative_generator()
@@ -130,7 +152,13 @@ class WindowsBuilder(PlatformBuilder):
                             UserWarning,
                         )
                 else:
-                    generator = self._detect_visual_studio_generator()
+                    # Prefer single-config Ninja when installed: it
+                    # configures and builds faster than MSBuild
+                    # multi-config and parallelizes without extra flags.
+                    if "Ninja" in _available_generators():
+                        generator = "Ninja"
+                    else:
+                        generator = self._detect_visual_studio_generator()
                     if not generator:
                         generator = self._detect_alternative_generator()
                         warnings.warn(
@@ -138,6 +166,7 @@ class WindowsBuilder(PlatformBuilder):
                             "For better compatibility, install Visual Studio or specify a generator with --generator.",
                             UserWarning,
                         )
+                self._store_cached_generator(generator)
 
             args.extend(["-G", generator])
             self._generator = generator
@@ -150,9 +179,19 @@ class WindowsBuilder(PlatformBuilder):
 
         return args
 
+    def get_generator(self, **kwargs) -> Optional[str]:
+        # get_cmake_args resolves (or detects) the generator and stashes
+        # it; ensure the memoized args exist and answer from the stash.
+        self.cached_cmake_args(**kwargs)
+        return self._generator
+
     def get_build_args(self) -> List[str]:
         if self._generator and self._generator.startswith("Visual Studio"):
-            return ["--config", "Release"]
+            # --parallel feeds cmake's job limit; -m after the -- makes
+            # MSBuild itself schedule projects across processors.
+            return ["--config", "Release", "--parallel", _jobs(), "--", "-m"]
+        if self._generator == "Ninja":
+            return ["--parallel", _jobs()]
         return []
 
     def get_executable_extension(self) -> str: